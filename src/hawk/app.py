@@ -1,13 +1,16 @@
-from typing import Optional
+import os
+from typing import Callable, Optional
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Static, ListView
 from textual.containers import Vertical
+from textual.css.query import NoMatches
 
-from hawk.config import PROJECTS_PATH
+from hawk.config import PROJECTS_PATH, load_config
 from hawk.db import Client, get_client, delete_client, CLIENTS_PATH
-from hawk.screens import DeleteClientScreen, HealthCheckScreen
+from hawk.utils import spawn_detached
 from hawk.widgets import (
     ProjectList,
     DetailPanel,
@@ -152,9 +155,20 @@ Footer > .footer--description {
 """
 
 
+def _has_projects_dir_entries() -> bool:
+    """Return True if PROJECTS_PATH exists and has at least one entry."""
+    try:
+        with os.scandir(PROJECTS_PATH) as it:
+            return next(it, None) is not None
+    except OSError:
+        return False
+
+
 class HawkApp(App):
     TITLE = "hawk-tui"
     CSS = CSS
+    HIGHLIGHT_DEBOUNCE = 0.05
+    ALERTS_DEBOUNCE = 0.2
 
     BINDINGS = [
         Binding("q", "quit_app", "Quit"),
@@ -167,13 +181,25 @@ class HawkApp(App):
     current_project: str = ""
     current_client_id: str = ""
     current_view: str = "projects"
-    missing_files_map: list = []
+    _highlight_timer: Timer | None = None
+    _highlighted_project: ProjectItem | None = None
+    _alerts_timer: Timer | None = None
+
+    # Widget handles cached in on_mount; project ones stay None in the empty state
+    _left_projects: Vertical | None = None
+    _project_list: ProjectList | None = None
+    _detail_panel: DetailPanel | None = None
+    _left_clients: Vertical
+    _client_list: ClientList
+    _client_detail: ClientDetailPanel
+    _alerts: AlertsPanel
+    _indicator: Static
 
     def compose(self) -> ComposeResult:
         yield Header()
         yield Static("[bold]Projects[/bold] | Clients", id="view-indicator")
 
-        if not PROJECTS_PATH.exists() or not any(PROJECTS_PATH.iterdir()):
+        if not _has_projects_dir_entries():
             yield Static(
                 "[bold]Welcome to hawk-tui![/bold]\n\n"
                 "No projects found in ~/ai/projects/\n\n"
@@ -196,31 +222,64 @@ class HawkApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        self._left_clients = self.query_one("#left-panel-clients", Vertical)
+        self._client_list = self.query_one(ClientList)
+        self._client_detail = self.query_one(ClientDetailPanel)
+        self._alerts = self.query_one(AlertsPanel)
+        self._indicator = self.query_one("#view-indicator", Static)
         try:
-            project_list = self.query_one(ProjectList)
-            project_list.focus()
-            if project_list.projects:
-                self.current_project = project_list.projects[0]
-                self.query_one(DetailPanel).project_name = self.current_project
-            self.set_timer(0.1, self._check_alerts)
-        except Exception:
-            pass
+            self._left_projects = self.query_one("#left-panel", Vertical)
+            self._project_list = self.query_one(ProjectList)
+            self._detail_panel = self.query_one(DetailPanel)
+        except NoMatches:
+            return
+
+        self._project_list.focus()
+        if self._project_list.projects:
+            self.current_project = self._project_list.projects[0]
+            self._detail_panel.project_name = self.current_project
+        self._check_alerts()
 
     def _check_alerts(self) -> None:
-        try:
-            self.missing_files_map = self.query_one(AlertsPanel).check_alerts(
-                self.query_one(ProjectList).projects
-            )
-        except Exception:
-            pass
+        # Coalesce bursts of triggers into one filesystem scan
+        if self._alerts_timer is not None:
+            self._alerts_timer.stop()
+        self._alerts_timer = self.set_timer(
+            self.ALERTS_DEBOUNCE, self._check_alerts_now
+        )
+
+    def _check_alerts_now(self) -> None:
+        self._alerts_timer = None
+        project_list = self._project_list
+        if project_list is None:
+            return
+        self._alerts.check_alerts(
+            list(project_list.projects), list(project_list.project_files)
+        )
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         if isinstance(event.item, ProjectItem):
             self.current_project = event.item.project_name
-            self.query_one(DetailPanel).project_name = event.item.project_name
+            self._highlighted_project = event.item
+            self._debounce_highlight(self._flush_project_highlight)
         elif isinstance(event.item, ClientItem):
             self.current_client_id = event.item.client.id
-            self.query_one(ClientDetailPanel).client_id = event.item.client.id
+            self._debounce_highlight(self._flush_client_highlight)
+
+    def _debounce_highlight(self, callback: Callable[[], None]) -> None:
+        # Coalesce rapid arrow-key scrolling into one detail render
+        if self._highlight_timer is not None:
+            self._highlight_timer.stop()
+        self._highlight_timer = self.set_timer(self.HIGHLIGHT_DEBOUNCE, callback)
+
+    def _flush_project_highlight(self) -> None:
+        self._highlight_timer = None
+        if self._highlighted_project is not None and self._detail_panel is not None:
+            self._detail_panel.show_project(self._highlighted_project)
+
+    def _flush_client_highlight(self) -> None:
+        self._highlight_timer = None
+        self._client_detail.client_id = self.current_client_id
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if isinstance(event.item, ClientItem):
@@ -233,62 +292,56 @@ class HawkApp(App):
         return True
 
     def action_switch_view(self) -> None:
-        try:
-            left_projects = self.query_one("#left-panel", Vertical)
-            detail_panel = self.query_one(DetailPanel)
-            left_clients = self.query_one("#left-panel-clients", Vertical)
-            client_detail = self.query_one(ClientDetailPanel)
-            indicator = self.query_one("#view-indicator", Static)
-
-            if self.current_view == "projects":
-                self.current_view = "clients"
-                left_projects.add_class("hidden")
-                detail_panel.add_class("hidden")
-                left_clients.remove_class("hidden")
-                client_detail.remove_class("hidden")
-                self.query_one(ClientList).focus()
-                indicator.update("[bold]Clients[/bold] | Projects")
-                client_list = self.query_one(ClientList)
-                if client_list.clients:
-                    self.current_client_id = client_list.clients[0].id
-                    self.query_one(ClientDetailPanel).client_id = self.current_client_id
-            else:
-                self.current_view = "projects"
-                left_clients.add_class("hidden")
-                client_detail.add_class("hidden")
-                left_projects.remove_class("hidden")
-                detail_panel.remove_class("hidden")
-                self.query_one(ProjectList).focus()
-                indicator.update("[bold]Projects[/bold] | Clients")
-            self.refresh_bindings()
-        except Exception:
-            pass
+        left_projects = self._left_projects
+        detail_panel = self._detail_panel
+        project_list = self._project_list
+        if left_projects is None or detail_panel is None or project_list is None:
+            return
+        left_clients = self._left_clients
+        client_detail = self._client_detail
+        client_list = self._client_list
+
+        if self.current_view == "projects":
+            self.current_view = "clients"
+            left_projects.add_class("hidden")
+            detail_panel.add_class("hidden")
+            left_clients.remove_class("hidden")
+            client_detail.remove_class("hidden")
+            client_list.focus()
+            self._indicator.update("[bold]Clients[/bold] | Projects")
+            if client_list.clients:
+                self.current_client_id = client_list.clients[0].id
+                client_detail.client_id = self.current_client_id
+        else:
+            self.current_view = "projects"
+            left_clients.add_class("hidden")
+            client_detail.add_class("hidden")
+            left_projects.remove_class("hidden")
+            detail_panel.remove_class("hidden")
+            project_list.focus()
+            self._indicator.update("[bold]Projects[/bold] | Clients")
+        self.refresh_bindings()
 
     def action_show_health_check(self) -> None:
+        from hawk.screens import HealthCheckScreen
+
         self.push_screen(HealthCheckScreen())
 
     def action_quit_app(self) -> None:
         self.exit()
 
     def action_new_client(self) -> None:
-        import subprocess
-        from hawk.config import load_config
-
-        config = load_config()
-        editor = config.get("tools", {}).get("editor", "code")
-        subprocess.Popen([editor, str(CLIENTS_PATH)])
-        self.notify(f"Opening {CLIENTS_PATH.name} in {editor}")
+        self._edit_client()
 
     def _edit_client(self) -> None:
-        import subprocess
-        from hawk.config import load_config
-
         config = load_config()
         editor = config.get("tools", {}).get("editor", "code")
-        subprocess.Popen([editor, str(CLIENTS_PATH)])
+        spawn_detached([editor, str(CLIENTS_PATH)])
         self.notify(f"Opening {CLIENTS_PATH.name} in {editor}")
 
     def action_delete_client(self) -> None:
+        from hawk.screens import DeleteClientScreen
+
         if self.current_view != "clients" or not self.current_client_id:
             return
         client = get_client(self.current_client_id)
@@ -299,8 +352,8 @@ class HawkApp(App):
             if confirmed:
                 delete_client(self.current_client_id)
                 self.current_client_id = ""
-                self.query_one(ClientList).load_clients()
-                self.query_one(ClientDetailPanel).client_id = ""
+                self._client_list.load_clients()
+                self._client_detail.client_id = ""
                 self.notify(f"Deleted client: {client.name}")
 
         self.push_screen(DeleteClientScreen(client.name), handle_delete)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 try:
@@ -9,19 +10,30 @@ PROJECTS_PATH = Path.home() / "ai" / "projects"
 CONFIG_PATH = Path.home() / "ai" / "projects" / "hawk-tui" / "data" / "config.toml"
 ROUTINE_PATH = Path.home() / "ai" / "projects" / "hawk-tui" / "data" / "routine.md"
 
-_config_cache: dict | None = None
+_config_cache: tuple[tuple[int, int] | None, dict] | None = None
 
 
 def load_config() -> dict:
     global _config_cache
-    if _config_cache is not None:
-        return _config_cache
+    try:
+        st = os.stat(CONFIG_PATH)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return _config_cache[1]
 
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, "rb") as f:
-            _config_cache = tomllib.load(f)
+    if stamp is not None:
+        try:
+            with open(CONFIG_PATH, "rb") as f:
+                config = tomllib.load(f)
+        except tomllib.TOMLDecodeError:
+            # Keep the last good config while config.toml is mid-edit
+            if _config_cache is None:
+                raise
+            return _config_cache[1]
     else:
-        _config_cache = {
+        config = {
             "tools": {
                 "ai_tools": ["claude", "opencode"],
                 "default_ai_tool": "",
@@ -30,4 +42,5 @@ def load_config() -> dict:
             },
             "paths": {"projects": "~/ai/projects"},
         }
-    return _config_cache
+    _config_cache = (stamp, config)
+    return config
@@ -1,21 +1,24 @@
 """Client data operations using TOML file."""
 
-from dataclasses import dataclass, field, asdict
+import os
+import shutil
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     import tomllib
 except ImportError:
     import tomli as tomllib
 
-import tomli_w
-
 CLIENTS_PATH = Path.home() / "ai" / "projects" / "hawk-tui" / "data" / "clients.toml"
+_parent_ensured = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Client:
     id: str  # slug, e.g. "missionperform"
     name: str
@@ -27,51 +30,129 @@ class Client:
     billing_cycle: str = "annual"  # annual, monthly, one-time
     amount: int = 0  # in dollars
     currency: str = "CAD"
-    next_payment: str = ""  # YYYY-MM-DD
+    next_payment: str | date = ""  # YYYY-MM-DD, or a date if written unquoted in TOML
     projects: list[str] = field(default_factory=list)
+    # (next_payment value, parsed date); reparsed whenever next_payment changes
+    _parsed_payment: tuple = field(
+        default=("", None), init=False, repr=False, compare=False
+    )
 
-    def payment_status(self) -> str:
+    def _payment_date(self) -> Optional[date]:
+        """Return next_payment as a date, parsing once per distinct value."""
+        source, parsed = self._parsed_payment
+        value = self.next_payment
+        if source == value:
+            return parsed
+        if isinstance(value, datetime):
+            parsed = value.date()
+        elif isinstance(value, date):
+            parsed = value
+        elif value:
+            try:
+                parsed = date.fromisoformat(value)
+            except ValueError:
+                parsed = None
+        else:
+            parsed = None
+        self._parsed_payment = (value, parsed)
+        return parsed
+
+    def payment_status(self, today: Optional[date] = None) -> str:
         """Return payment status: paid, due_soon, overdue, or none."""
-        if not self.next_payment:
-            return "none"
-        try:
-            next_date = date.fromisoformat(self.next_payment)
-            today = date.today()
-            days_until = (next_date - today).days
-            if days_until < 0:
-                return "overdue"
-            elif days_until <= 14:
-                return "due_soon"
-            else:
-                return "paid"
-        except ValueError:
-            return "none"
-
-    def days_until_payment(self) -> Optional[int]:
+        return self.payment_status_and_days(today)[0]
+
+    def payment_status_and_days(
+        self, today: Optional[date] = None
+    ) -> tuple[str, Optional[int]]:
+        """Return (payment_status, days_until_payment) from one date subtraction."""
+        days_until = self.days_until_payment(today)
+        if days_until is None:
+            return "none", None
+        if days_until < 0:
+            return "overdue", days_until
+        elif days_until <= 14:
+            return "due_soon", days_until
+        else:
+            return "paid", days_until
+
+    def days_until_payment(self, today: Optional[date] = None) -> Optional[int]:
         """Return days until next payment, negative if overdue."""
-        if not self.next_payment:
-            return None
-        try:
-            next_date = date.fromisoformat(self.next_payment)
-            return (next_date - date.today()).days
-        except ValueError:
+        next_date = self._payment_date()
+        if next_date is None:
             return None
+        return (next_date - (today or date.today())).days
 
 
 def _load_clients() -> list[dict]:
     """Load clients from TOML file."""
-    if not CLIENTS_PATH.exists():
+    try:
+        with open(CLIENTS_PATH, "rb") as f:
+            data = tomllib.load(f)
+    except FileNotFoundError:
         return []
-    with open(CLIENTS_PATH, "rb") as f:
-        data = tomllib.load(f)
     return data.get("clients", [])
 
 
 def _save_clients(clients: list[dict]) -> None:
     """Save clients to TOML file."""
-    CLIENTS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CLIENTS_PATH, "wb") as f:
-        tomli_w.dump({"clients": clients}, f)
+    global _parent_ensured
+    import tomli_w
+
+    if not _parent_ensured:
+        CLIENTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _parent_ensured = True
+    # Replace the real file so a symlinked clients.toml stays a symlink
+    real_path = Path(os.path.realpath(CLIENTS_PATH))
+    tmp_path = real_path.with_name(real_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            tomli_w.dump({"clients": clients}, f)
+        if real_path.exists():
+            # Keep the original mode; clients.toml holds contact details
+            shutil.copymode(real_path, tmp_path)
+        os.replace(tmp_path, real_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _cached_clients.cache_clear()
+    _client_index.cache_clear()
+
+
+@contextmanager
+def clients_txn() -> Iterator[list[dict]]:
+    """Load clients once, yield them for mutation, and save once on exit."""
+    clients = _load_clients()
+    yield clients
+    _save_clients(clients)
+
+
+def _clients_stamp() -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) of the clients file, or None if missing."""
+    try:
+        st = os.stat(CLIENTS_PATH)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=1)
+def _cached_clients(stamp: Optional[tuple[int, int]]) -> tuple[Client, ...]:
+    """Parse clients once per file version; stamp only keys the cache."""
+    return tuple(_dict_to_client(d) for d in _load_clients())
+
+
+@lru_cache(maxsize=1)
+def _client_index(
+    stamp: Optional[tuple[int, int]],
+) -> tuple[dict[str, Client], dict[str, Client]]:
+    """Map client id and project slug to Client; first match wins as in a scan."""
+    by_id: dict[str, Client] = {}
+    by_project: dict[str, Client] = {}
+    for client in _cached_clients(stamp):
+        by_id.setdefault(client.id, client)
+        for slug in client.projects:
+            by_project.setdefault(slug, client)
+    return by_id, by_project
 
 
 def _dict_to_client(d: dict) -> Client:
@@ -94,94 +175,105 @@ def _dict_to_client(d: dict) -> Client:
 
 def _client_to_dict(c: Client) -> dict:
     """Convert Client to dict for TOML."""
-    return asdict(c)
+    return {
+        "id": c.id,
+        "name": c.name,
+        "company": c.company,
+        "email": c.email,
+        "phone": c.phone,
+        "address": c.address,
+        "notes": c.notes,
+        "billing_cycle": c.billing_cycle,
+        "amount": c.amount,
+        "currency": c.currency,
+        "next_payment": c.next_payment,
+        "projects": list(c.projects),
+    }
+
+
+def _copy_client(client: Client) -> Client:
+    """Return a copy callers may mutate without touching the cached Client."""
+    return replace(client, projects=list(client.projects))
 
 
 # --- Client CRUD ---
 
 def get_all_clients() -> list[Client]:
     """Get all clients."""
-    return [_dict_to_client(d) for d in _load_clients()]
+    return [_copy_client(c) for c in _cached_clients(_clients_stamp())]
 
 
 def get_client(client_id: str) -> Optional[Client]:
     """Get a single client by ID."""
-    for d in _load_clients():
-        if d.get("id") == client_id:
-            return _dict_to_client(d)
-    return None
+    client = _client_index(_clients_stamp())[0].get(client_id)
+    return _copy_client(client) if client else None
 
 
 def create_client(client: Client) -> str:
     """Create a new client, return ID."""
-    clients = _load_clients()
-    clients.append(_client_to_dict(client))
-    _save_clients(clients)
+    with clients_txn() as clients:
+        clients.append(_client_to_dict(client))
     return client.id
 
 
 def update_client(client: Client) -> None:
     """Update an existing client."""
-    clients = _load_clients()
-    for i, d in enumerate(clients):
-        if d.get("id") == client.id:
-            clients[i] = _client_to_dict(client)
-            break
-    _save_clients(clients)
+    with clients_txn() as clients:
+        for i, d in enumerate(clients):
+            if d.get("id") == client.id:
+                clients[i] = _client_to_dict(client)
+                break
 
 
 def delete_client(client_id: str) -> None:
     """Delete a client."""
-    clients = [d for d in _load_clients() if d.get("id") != client_id]
-    _save_clients(clients)
+    with clients_txn() as clients:
+        clients[:] = [d for d in clients if d.get("id") != client_id]
 
 
 # --- Project-Client linking ---
 
 def get_client_for_project(project_slug: str) -> Optional[Client]:
     """Get the client linked to a project."""
-    for client in get_all_clients():
-        if project_slug in client.projects:
-            return client
-    return None
+    client = _client_index(_clients_stamp())[1].get(project_slug)
+    return _copy_client(client) if client else None
 
 
 def link_project_to_client(project_slug: str, client_id: str) -> None:
     """Link a project to a client."""
-    clients = _load_clients()
-    for d in clients:
-        # Remove from other clients first
-        if project_slug in d.get("projects", []):
-            d["projects"].remove(project_slug)
-        # Add to target client
-        if d.get("id") == client_id:
-            if "projects" not in d:
-                d["projects"] = []
-            if project_slug not in d["projects"]:
-                d["projects"].append(project_slug)
-    _save_clients(clients)
+    with clients_txn() as clients:
+        for d in clients:
+            # Remove from other clients first
+            if project_slug in d.get("projects", []):
+                d["projects"].remove(project_slug)
+            # Add to target client
+            if d.get("id") == client_id:
+                if "projects" not in d:
+                    d["projects"] = []
+                if project_slug not in d["projects"]:
+                    d["projects"].append(project_slug)
 
 
 def unlink_project_from_client(project_slug: str) -> None:
     """Remove project from any client."""
-    clients = _load_clients()
-    for d in clients:
-        if project_slug in d.get("projects", []):
-            d["projects"].remove(project_slug)
-    _save_clients(clients)
+    with clients_txn() as clients:
+        for d in clients:
+            if project_slug in d.get("projects", []):
+                d["projects"].remove(project_slug)
 
 
 def get_projects_for_client(client_id: str) -> list[str]:
     """Get all project slugs linked to a client."""
-    client = get_client(client_id)
-    return client.projects if client else []
+    client = _client_index(_clients_stamp())[0].get(client_id)
+    # Copy so callers can't mutate the cached Client's list
+    return list(client.projects) if client else []
 
 
 def get_upcoming_payments(days: int = 14) -> list[Client]:
     """Get clients with payments due within N days."""
-    result = []
-    for client in get_all_clients():
-        status = client.payment_status()
-        if status in ("due_soon", "overdue"):
-            result.append(client)
-    return result
+    today = date.today()
+    return [
+        _copy_client(client)
+        for client in _cached_clients(_clients_stamp())
+        if client.payment_status(today) in ("due_soon", "overdue")
+    ]
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from textual import work
 from textual.binding import Binding
 from textual.screen import ModalScreen
 from textual.widgets import Static, Button, ListView, ListItem, Label
@@ -55,26 +56,39 @@ class LinkClientScreen(ModalScreen[Optional[str]]):
         super().__init__()
         self.project_name = project_name
         self.current_client_id = current_client_id
-        self.clients = get_all_clients()
+        self.clients: list[Client] = []
         self.selected_id: Optional[str] = current_client_id
 
     def compose(self):
         with Vertical(id="link-dialog"):
             yield Static(f"Link {self.project_name} to client", id="link-title")
-            lv = ListView()
-            lv.append(ListItem(Label("(No client)"), id="client-none"))
-            for c in self.clients:
-                lv.append(
-                    ListItem(
-                        Label(f"{c.name} ({c.company})" if c.company else c.name),
-                        id=f"client-{c.id}",
-                    )
-                )
-            yield lv
+            yield ListView(
+                ListItem(Label("(No client)"), id="client-none"), id="client-list"
+            )
             with Horizontal():
                 yield Button("Link", id="link", variant="primary")
                 yield Button("Cancel", id="cancel")
 
+    def on_mount(self) -> None:
+        self._load_clients()
+
+    @work(thread=True, exclusive=True)
+    def _load_clients(self) -> None:
+        """Fetch clients off the UI thread so the dialog opens immediately."""
+        self.app.call_from_thread(self._show_clients, get_all_clients())
+
+    def _show_clients(self, clients: list[Client]) -> None:
+        if not self.is_mounted:
+            return  # Dismissed while the worker was loading
+        self.clients = clients
+        self.query_one("#client-list", ListView).extend(
+            ListItem(
+                Label(f"{c.name} ({c.company})" if c.company else c.name),
+                id=f"client-{c.id}",
+            )
+            for c in clients
+        )
+
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         if event.item and event.item.id:
             if event.item.id == "client-none":
@@ -92,6 +106,23 @@ class LinkClientScreen(ModalScreen[Optional[str]]):
         self.dismiss(self.current_client_id)
 
 
+_HEALTH_CHECK_TEXT = "\n".join(
+    [
+        "",
+        "Checks each project in ~/ai/projects/ for:",
+        "",
+        "  [green]•[/green] project.md, session.md, gotchas.md exist",
+        "  [green]•[/green] session.md updated within 7 days",
+        "  [green]•[/green] Repo: path defined in project.md",
+        "  [green]•[/green] Repo path actually exists on disk",
+        "  [green]•[/green] CLAUDE.md symlink exists in repo",
+        "  [green]•[/green] AGENTS.md exists in repo",
+        "",
+        "[dim]Press Esc to close[/dim]",
+    ]
+)
+
+
 class HealthCheckScreen(ModalScreen[None]):
     BINDINGS = [
         Binding("escape", "dismiss", "Close"),
@@ -107,14 +138,4 @@ class HealthCheckScreen(ModalScreen[None]):
     def compose(self):
         with Vertical(id="health-dialog"):
             yield Static("Health Check (runs on startup)", id="health-title")
-            yield Static("")
-            yield Static("Checks each project in ~/ai/projects/ for:")
-            yield Static("")
-            yield Static("  [green]•[/green] project.md, session.md, gotchas.md exist")
-            yield Static("  [green]•[/green] session.md updated within 7 days")
-            yield Static("  [green]•[/green] Repo: path defined in project.md")
-            yield Static("  [green]•[/green] Repo path actually exists on disk")
-            yield Static("  [green]•[/green] CLAUDE.md symlink exists in repo")
-            yield Static("  [green]•[/green] AGENTS.md exists in repo")
-            yield Static("")
-            yield Static("[dim]Press Esc to close[/dim]")
+            yield Static(_HEALTH_CHECK_TEXT)
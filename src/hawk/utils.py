@@ -1,53 +1,96 @@
 import subprocess
-from datetime import datetime
+import time
 from pathlib import Path
+from stat import S_ISDIR
+
+_HOME_STR = str(Path.home())
+_MINUTE = 60
+_HOUR = 60 * _MINUTE
+_DAY = 24 * _HOUR
+
+# Keyed on the HEAD file found, so subdirs of one repo share an entry
+_branch_cache: dict[Path, tuple[int, str]] = {}
+
+
+def _git_head_path(repo_path: Path) -> Path | None:
+    # Like git, use the nearest enclosing .git so monorepo subdirs resolve
+    for directory in (repo_path, *repo_path.parents):
+        git_path = directory / ".git"
+        try:
+            st = git_path.stat()
+        except OSError:
+            continue
+        if S_ISDIR(st.st_mode):
+            return git_path / "HEAD"
+        # Linked worktree: .git is a file containing "gitdir: <path>"
+        content = git_path.read_text().strip()
+        if content.startswith("gitdir:"):
+            gitdir = Path(content[7:].strip())
+            if not gitdir.is_absolute():
+                gitdir = directory / gitdir
+            return gitdir / "HEAD"
+        return None
+    return None
 
 
 def get_git_branch(repo_path: Path) -> str:
-    if not repo_path.exists():
-        return ""
     try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-        return result.stdout.strip() if result.returncode == 0 else ""
-    except Exception:
+        head = _git_head_path(repo_path)
+        if head is None:
+            return ""
+        mtime_ns = head.stat().st_mtime_ns
+        cached = _branch_cache.get(head)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        content = head.read_text().strip()
+    except OSError:
         return ""
+    if content.startswith("ref: refs/heads/"):
+        branch = content[16:]
+    elif content.startswith("ref: "):
+        branch = content[5:]
+    else:
+        # Detached HEAD: show the short commit hash
+        branch = content[:7]
+    _branch_cache[head] = (mtime_ns, branch)
+    return branch
 
 
-def get_relative_time(dt: datetime) -> str:
-    now = datetime.now()
-    diff = now - dt
-    if diff.days > 30:
-        return f"{diff.days // 30} months ago"
-    elif diff.days > 0:
-        return f"{diff.days} days ago" if diff.days > 1 else "yesterday"
-    elif diff.seconds > 3600:
-        hours = diff.seconds // 3600
+def get_relative_time(mtime_ns: int) -> str:
+    days, seconds = divmod((time.time_ns() - mtime_ns) // 1_000_000_000, _DAY)
+    if days > 30:
+        return f"{days // 30} months ago"
+    elif days > 0:
+        return f"{days} days ago" if days > 1 else "yesterday"
+    elif seconds > _HOUR:
+        hours = seconds // _HOUR
         return f"{hours} hours ago" if hours > 1 else "1 hour ago"
-    elif diff.seconds > 60:
-        return f"{diff.seconds // 60} min ago"
+    elif seconds > _MINUTE:
+        return f"{seconds // _MINUTE} min ago"
     else:
         return "just now"
 
 
 def parse_repo_path(content: str) -> Path | None:
-    for line in content.split("\n"):
-        if line.startswith("Repo:"):
-            path_str = line.replace("Repo:", "").strip()
-            if path_str.startswith("~"):
-                path_str = str(Path.home()) + path_str[1:]
-            return Path(path_str)
-    return None
+    if content.startswith("Repo:"):
+        start = 0
+    else:
+        start = content.find("\nRepo:")
+        if start == -1:
+            return None
+        start += 1
+    end = content.find("\n", start)
+    path_str = content[start + 5 : end if end != -1 else None].strip()
+    if path_str.startswith("~"):
+        path_str = _HOME_STR + path_str[1:]
+    return Path(path_str)
 
 
-def launch_iterm_session(repo_path: Path, tool: str) -> None:
-    path_str = str(repo_path).replace('"', '\\"')
-    script = f'''
+# Repo path and tool arrive via argv, so the script never needs re-escaping
+_ITERM_SCRIPT = """
+on run argv
+    set repoPath to quoted form of item 1 of argv
+    set toolName to item 2 of argv
     tell application "iTerm"
         activate
         if (count of windows) = 0 then
@@ -58,12 +101,27 @@ def launch_iterm_session(repo_path: Path, tool: str) -> None:
             end tell
         end if
         tell current session of current window
-            write text "cd \\"{path_str}\\" && {tool} --prompt \\"read session context\\""
+            write text "cd " & repoPath & " && " & toolName & " --prompt \\"read session context\\""
             set rightPane to (split vertically with default profile)
         end tell
         tell rightPane
-            write text "cd \\"{path_str}\\""
+            write text "cd " & repoPath
         end tell
     end tell
-    '''
-    subprocess.run(["osascript", "-e", script])
+end run
+"""
+
+
+def spawn_detached(args: list[str]) -> None:
+    # Detached so the child can't write over the TUI or get our signals
+    subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def launch_iterm_session(repo_path: Path, tool: str) -> None:
+    spawn_detached(["osascript", "-e", _ITERM_SCRIPT, str(repo_path), tool])
@@ -1,30 +1,179 @@
-import re
-import subprocess
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from textual.app import ComposeResult
 from textual.widgets import Static, ListView, ListItem, Label
 from textual.containers import Vertical, Horizontal
 from textual.reactive import reactive
-from textual import events
+from textual import events, work
 
 from hawk.config import PROJECTS_PATH, ROUTINE_PATH, load_config
-from hawk.db import Client, get_client_for_project
+from hawk.db import Client, get_client, get_client_for_project
 from hawk.utils import (
     get_git_branch,
     get_relative_time,
     parse_repo_path,
     launch_iterm_session,
+    spawn_detached,
 )
 
+PROJECT_FILES = ("project.md", "session.md", "gotchas.md")
+STATUS_SCAN_BYTES = 2048
+SESSION_SECTIONS = ("## What's Next", "## Recent Work")
+
+# Shared by the project scan and alert checks; per-project work is I/O bound
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hawk-io")
+
+_PROGRESS_BARS = tuple(
+    f"[green]{'█' * filled}{'░' * (20 - filled)}[/green]" for filled in range(21)
+)
+
+ACTION_LABELS = ("Editor", "OpenCode", "Claude")
+
+# Action bar markup indexed by focused action + 1 (index 0: nothing focused)
+_ACTION_BARS = tuple(
+    "  ".join(
+        (
+            f"[black on #b8bb26] {label} [/]"
+            if i == focused
+            else f"[#a89984]\\[{label}][/]"
+        )
+        for i, label in enumerate(ACTION_LABELS)
+    )
+    for focused in range(-1, len(ACTION_LABELS))
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedProject:
+    repo_path: Path | None = None
+    done_tasks: int = 0
+    total_tasks: int = 0
+    whats_next: str = ""
+    recent_work: str = ""
+    gotchas: tuple[str, ...] = ()
+
+
+def _list_names(path: Path) -> frozenset[str]:
+    """Names of existing entries in path; dangling symlinks count as missing."""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(
+                e.name for e in it if not e.is_symlink() or os.path.exists(e.path)
+            )
+    except OSError:
+        return frozenset()
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for cache keys, or None if the file is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _symlink_points_to(link_path: str, expected: Path) -> bool:
+    """Check a symlink's target, resolving full paths only if the literal differs."""
+    try:
+        target = os.readlink(link_path)
+    except OSError:
+        return False
+    # Absolute targets without ".." can be compared lexically; anything else
+    # needs the full resolve
+    if os.path.isabs(target) and ".." not in target.split(os.sep):
+        if os.path.normpath(target) == str(expected):
+            return True
+    return Path(link_path).resolve() == expected.resolve()
+
+
+@lru_cache(maxsize=64)
+def _read_cached(path: Path, stamp: tuple[int, int]) -> str:
+    """Read a text file once per (mtime_ns, size) stamp."""
+    return path.read_text()
+
+
+def _parse_session(content: str) -> tuple[int, int, str, str]:
+    """Return (done, total, whats_next, recent_work) from session.md text."""
+    # str.count runs in C over the whole buffer; cheaper than counting per line
+    done = content.count("[x]") + content.count("[X]")
+    total = done + content.count("[ ]")
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    current_header: str | None = None
+    for line in content.split("\n"):
+        if line.startswith("## "):
+            header = next((h for h in SESSION_SECTIONS if line.startswith(h)), None)
+            if header is not None and header == current_header:
+                continue  # Repeated heading (e.g. dated blocks) continues the section
+            # Any other heading ends the section; each section is taken once
+            current = current_header = None
+            if header is not None and header not in sections:
+                current = sections[header] = []
+                current_header = header
+        elif current is not None and line.strip():
+            current.append(line)
+    whats_next, recent_work = (
+        "\n".join(sections.get(header, [])[:10]) for header in SESSION_SECTIONS
+    )
+    return done, total, whats_next, recent_work
+
+
+def _iter_gotchas(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith(("-", "•")) and stripped not in ("---", "-"):
+            yield line.rstrip("\n")
+
+
+@lru_cache(maxsize=128)
+def _parse_project(
+    project_path: Path, stamps: tuple[tuple[int, int] | None, ...]
+) -> ParsedProject:
+    """Parse a project's markdown files; file stamps only key the cache."""
+    project_stamp, session_stamp, gotchas_stamp = stamps
+    repo_path = None
+    if project_stamp is not None:
+        repo_path = parse_repo_path(
+            _read_cached(project_path / "project.md", project_stamp)
+        )
+
+    done_tasks = total_tasks = 0
+    whats_next = recent_work = ""
+    if session_stamp is not None:
+        session_content = _read_cached(project_path / "session.md", session_stamp)
+        done_tasks, total_tasks, whats_next, recent_work = _parse_session(
+            session_content
+        )
+
+    gotchas: tuple[str, ...] = ()
+    if gotchas_stamp is not None:
+        with open(project_path / "gotchas.md") as f:
+            gotchas = tuple(islice(_iter_gotchas(f), 5))
+
+    return ParsedProject(
+        repo_path, done_tasks, total_tasks, whats_next, recent_work, gotchas
+    )
+
 
 class ProjectItem(ListItem):
     def __init__(
-        self, name: str, status: str = "active", has_warning: bool = False
+        self,
+        name: str,
+        status: str = "active",
+        has_warning: bool = False,
+        project_path: Path | None = None,
     ) -> None:
         super().__init__()
         self.project_name = name
+        self.project_path = project_path or PROJECTS_PATH / name
         self.project_status = status
         self.has_warning = has_warning
 
@@ -41,6 +190,8 @@ class ProjectList(ListView):
     def __init__(self) -> None:
         super().__init__()
         self.projects: list[str] = []
+        # Parallel to projects: the file names found in each project directory
+        self.project_files: list[frozenset[str]] = []
 
     def on_mount(self) -> None:
         self.load_projects()
@@ -54,28 +205,45 @@ class ProjectList(ListView):
     def load_projects(self) -> None:
         self.clear()
         self.projects = []
-        if not PROJECTS_PATH.exists():
+        self.project_files = []
+        try:
+            with os.scandir(PROJECTS_PATH) as it:
+                entries = [e for e in it if e.is_dir() and not e.name.startswith(".")]
+        except FileNotFoundError:
             return
-        for project_dir in sorted(PROJECTS_PATH.iterdir()):
-            if project_dir.is_dir() and not project_dir.name.startswith("."):
-                status = "active"
-                has_warning = False
-                project_md = project_dir / "project.md"
-                if project_md.exists():
-                    content = project_md.read_text()
-                    if "Status: archived" in content:
-                        status = "archived"
-                if (
-                    not (project_dir / "session.md").exists()
-                    or not (project_dir / "gotchas.md").exists()
-                ):
-                    has_warning = True
-                self.projects.append(project_dir.name)
-                self.append(ProjectItem(project_dir.name, status, has_warning))
+        entries.sort(key=lambda e: e.name)
+        project_dirs = [Path(e.path) for e in entries]
+        results = list(_IO_POOL.map(self._scan_project, project_dirs))
+        items = []
+        for project_dir, (status, has_warning, names) in zip(project_dirs, results):
+            self.projects.append(project_dir.name)
+            self.project_files.append(names)
+            items.append(
+                ProjectItem(project_dir.name, status, has_warning, project_dir)
+            )
+        # Mount every row in one pass rather than one layout per append
+        self.extend(items)
+
+    @staticmethod
+    def _scan_project(project_dir: Path) -> tuple[str, bool, frozenset[str]]:
+        names = _list_names(project_dir)
+        status = "active"
+        if "project.md" in names:
+            # The status line sits in the header; don't read the whole document
+            try:
+                with open(project_dir / "project.md", "rb") as f:
+                    head = f.read(STATUS_SCAN_BYTES)
+            except OSError:
+                head = b""
+            if b"Status: archived" in head:
+                status = "archived"
+        has_warning = "session.md" not in names or "gotchas.md" not in names
+        return status, has_warning, names
 
 
 class DetailPanel(Vertical):
     project_name = reactive("")
+    project_path: Path | None = None
 
     def compose(self) -> ComposeResult:
         yield Static("Select a project", id="detail-header")
@@ -85,21 +253,17 @@ class DetailPanel(Vertical):
         yield Static("", id="detail-content")
 
     def on_mount(self) -> None:
+        self._header = self.query_one("#detail-header", Static)
+        self._actions = self.query_one("#detail-actions", Static)
+        self._meta = self.query_one("#detail-meta", Static)
+        self._progress = self.query_one("#detail-progress", Static)
+        self._content = self.query_one("#detail-content", Static)
         self._update_actions()
 
     def _update_actions(self, focused_idx: int = -1) -> None:
-        labels = ["Editor", "OpenCode", "Claude"]
-        parts = []
-        for i, label in enumerate(labels):
-            if i == focused_idx:
-                parts.append(f"[black on #b8bb26] {label} [/]")
-            else:
-                parts.append(f"[#a89984]\\[{label}][/]")
-        self.query_one("#detail-actions", Static).update("  ".join(parts))
-
-    @property
-    def action_labels(self) -> list[str]:
-        return ["Editor", "OpenCode", "Claude"]
+        if not -1 <= focused_idx < len(ACTION_LABELS):
+            focused_idx = -1
+        self._actions.update(_ACTION_BARS[focused_idx + 1])
 
     focused_action: int = -1
     can_focus = True
@@ -125,7 +289,7 @@ class DetailPanel(Vertical):
                 self._update_actions(self.focused_action)
             event.stop()
         elif event.key == "right":
-            if self.focused_action < len(self.action_labels) - 1:
+            if self.focused_action < len(ACTION_LABELS) - 1:
                 self.focused_action += 1
                 self._update_actions(self.focused_action)
             event.stop()
@@ -136,12 +300,12 @@ class DetailPanel(Vertical):
     def _execute_action(self, idx: int) -> None:
         if not self.project_name or idx < 0:
             return
-        project_path = PROJECTS_PATH / self.project_name
-        project_md = project_path / "project.md"
-        if not project_md.exists():
+        project_path = self._project_path(self.project_name)
+        stamps = tuple(_file_stamp(project_path / f) for f in PROJECT_FILES)
+        if stamps[0] is None:
             self.app.notify("No project.md found")
             return
-        repo_path = parse_repo_path(project_md.read_text())
+        repo_path = _parse_project(project_path, stamps).repo_path
         if not repo_path or not repo_path.exists():
             self.app.notify("Repo path missing or invalid")
             return
@@ -149,7 +313,7 @@ class DetailPanel(Vertical):
         config = load_config()
         if idx == 0:
             editor = config.get("tools", {}).get("editor", "antigravity")
-            subprocess.Popen([editor, str(repo_path)])
+            spawn_detached([editor, str(repo_path)])
             self.app.notify(f"Opening in {editor}")
         elif idx == 1:
             launch_iterm_session(repo_path, "opencode")
@@ -158,26 +322,39 @@ class DetailPanel(Vertical):
             launch_iterm_session(repo_path, "claude")
             self.app.notify(f"Launching claude for {self.project_name}")
 
+    def show_project(self, item: ProjectItem) -> None:
+        self.project_path = item.project_path
+        self.project_name = item.project_name
+
+    def _project_path(self, name: str) -> Path:
+        if self.project_path is not None and self.project_path.name == name:
+            return self.project_path
+        return PROJECTS_PATH / name
+
     def watch_project_name(self, name: str) -> None:
         if not name:
-            self.query_one("#detail-header", Static).update("Select a project")
-            self.query_one("#detail-meta", Static).update("")
-            self.query_one("#detail-progress", Static).update("")
-            self.query_one("#detail-content", Static).update("")
+            with self.app.batch_update():
+                self._header.update("Select a project")
+                self._meta.update("")
+                self._progress.update("")
+                self._content.update("")
             return
 
-        self.query_one("#detail-header", Static).update(f"[bold]{name}[/bold]")
-        project_path = PROJECTS_PATH / name
+        self._load_project(name, self._project_path(name))
+
+    @work(thread=True, exclusive=True)
+    def _load_project(self, name: str, project_path: Path) -> None:
+        """Read and format a project's details off the UI thread."""
+        stamps = tuple(_file_stamp(project_path / f) for f in PROJECT_FILES)
+        project = _parse_project(project_path, stamps)
         content_parts: list[str] = []
         meta_parts: list[str] = []
 
-        project_md = project_path / "project.md"
-        repo_path = None
-        if project_md.exists():
-            project_content = project_md.read_text()
-            repo_path = parse_repo_path(project_content)
+        repo_path = project.repo_path
+        repo_exists = repo_path is not None and repo_path.exists()
+        if stamps[0] is not None:
             if repo_path:
-                if repo_path.exists():
+                if repo_exists:
                     meta_parts.append(f"[dim]Repo: {repo_path}[/dim]")
                 else:
                     meta_parts.append(f"[red]Repo: {repo_path} (not found)[/red]")
@@ -186,7 +363,7 @@ class DetailPanel(Vertical):
         else:
             meta_parts.append("[red]project.md missing[/red]")
 
-        if repo_path and repo_path.exists():
+        if repo_exists:
             branch = get_git_branch(repo_path)
             if branch:
                 meta_parts.append(f"[cyan]Branch:[/cyan] {branch}")
@@ -195,61 +372,60 @@ class DetailPanel(Vertical):
         if linked_client:
             meta_parts.append(f"[magenta]Client:[/magenta] {linked_client.name}")
 
-        session_md = project_path / "session.md"
-        total_tasks = done_tasks = 0
-        if session_md.exists():
-            session_content = session_md.read_text()
-            mtime = datetime.fromtimestamp(session_md.stat().st_mtime)
-            meta_parts.append(
-                f"[dim]{get_relative_time(mtime)} ({mtime.strftime('%b %d')})[/dim]"
-            )
-            done_tasks = len(re.findall(r"\[x\]", session_content, re.IGNORECASE))
-            undone_tasks = len(re.findall(r"\[ \]", session_content))
-            total_tasks = done_tasks + undone_tasks
-            whats_next = self._extract_section(session_content, "## What's Next")
-            if whats_next:
-                content_parts.extend(["[green]## What's Next[/green]", whats_next, ""])
-            recent_work = self._extract_section(session_content, "## Recent Work")
-            if recent_work:
-                content_parts.extend(["[blue]## Recent Work[/blue]", recent_work, ""])
-
-        self.query_one("#detail-meta", Static).update("\n".join(meta_parts))
+        if stamps[1] is not None:
+            mtime_ns = stamps[1][0]
+            modified = datetime.fromtimestamp(mtime_ns / 1e9).strftime("%b %d")
+            meta_parts.append(f"[dim]{get_relative_time(mtime_ns)} ({modified})[/dim]")
+            if project.whats_next:
+                content_parts.extend(
+                    ["[green]## What's Next[/green]", project.whats_next, ""]
+                )
+            if project.recent_work:
+                content_parts.extend(
+                    ["[blue]## Recent Work[/blue]", project.recent_work, ""]
+                )
 
+        done_tasks, total_tasks = project.done_tasks, project.total_tasks
+        progress = ""
         if total_tasks > 0:
-            filled = int(20 * done_tasks / total_tasks)
-            bar = "█" * filled + "░" * (20 - filled)
-            self.query_one("#detail-progress", Static).update(
-                f"[green]{bar}[/green] {done_tasks}/{total_tasks} tasks"
+            bar = _PROGRESS_BARS[int(20 * done_tasks / total_tasks)]
+            progress = f"{bar} {done_tasks}/{total_tasks} tasks"
+
+        if project.gotchas:
+            content_parts.extend(
+                ["[yellow]## Gotchas[/yellow]", "\n".join(project.gotchas)]
             )
-        else:
-            self.query_one("#detail-progress", Static).update("")
-
-        gotchas_md = project_path / "gotchas.md"
-        if gotchas_md.exists():
-            gotchas = []
-            for line in gotchas_md.read_text().split("\n"):
-                stripped = line.strip()
-                if stripped.startswith(("-", "•")) and stripped not in ("---", "-"):
-                    gotchas.append(line)
-            if gotchas:
-                content_parts.extend(
-                    ["[yellow]## Gotchas[/yellow]", "\n".join(gotchas[:5])]
-                )
 
-        self.query_one("#detail-content", Static).update(
-            "\n".join(content_parts) if content_parts else "No session.md found"
+        self.app.call_from_thread(
+            self._show_project,
+            name,
+            "\n".join(meta_parts),
+            progress,
+            "\n".join(content_parts) if content_parts else "No session.md found",
         )
 
-    def _extract_section(self, content: str, header: str) -> str:
-        lines, in_section, section_lines = content.split("\n"), False, []
-        for line in lines:
-            if line.startswith(header):
-                in_section = True
-            elif in_section and line.startswith("## "):
-                break
-            elif in_section and line.strip():
-                section_lines.append(line)
-        return "\n".join(section_lines[:10])
+    def _show_project(self, name: str, meta: str, progress: str, content: str) -> None:
+        if name != self.project_name:
+            return  # The selection moved on while this project was loading
+        # One repaint for all sections instead of one per update
+        with self.app.batch_update():
+            self._header.update(f"[bold]{name}[/bold]")
+            self._meta.update(meta)
+            self._progress.update(progress)
+            self._content.update(content)
+
+
+@lru_cache(maxsize=1)
+def _render_routine(path: Path, stamp: tuple[int, int]) -> str:
+    """Render routine.md headings and quoted steps as markup, once per stamp."""
+    lines = []
+    for line in _read_cached(path, stamp).split("\n"):
+        line = line.strip()
+        if line.startswith("## "):
+            lines.append(f"[green]{line[3:]}:[/green]")
+        elif line.startswith('"'):
+            lines.append(f"  [dim]{line}[/dim]")
+    return "\n".join(lines)
 
 
 class SOPPanel(Static):
@@ -261,16 +437,11 @@ class SOPPanel(Static):
         self._load_routine()
 
     def _load_routine(self) -> None:
-        if ROUTINE_PATH.exists():
-            content = ROUTINE_PATH.read_text()
-            lines = []
-            for line in content.split("\n"):
-                line = line.strip()
-                if line.startswith("## "):
-                    lines.append(f"[green]{line[3:]}:[/green]")
-                elif line.startswith('"'):
-                    lines.append(f"  [dim]{line}[/dim]")
-            self.query_one("#sop-content", Static).update("\n".join(lines))
+        stamp = _file_stamp(ROUTINE_PATH)
+        if stamp is not None:
+            self.query_one("#sop-content", Static).update(
+                _render_routine(ROUTINE_PATH, stamp)
+            )
         else:
             self.query_one("#sop-content", Static).update(
                 "[dim]No routine.md found[/dim]"
@@ -279,62 +450,82 @@ class SOPPanel(Static):
 
 class AlertsPanel(Static):
     STALE_DAYS = 7
+    missing_files_map: list[tuple[str, list[str]]] = []
 
     def compose(self) -> ComposeResult:
         yield Static("No alerts", id="alerts-content")
 
-    def check_alerts(self, projects: list[str]) -> list[tuple[str, list[str]]]:
+    @work(thread=True, exclusive=True)
+    def check_alerts(
+        self, projects: list[str], project_files: list[frozenset[str]] | None = None
+    ) -> None:
         alerts: list[str] = []
         missing_files_map: list[tuple[str, list[str]]] = []
-        for name in projects:
-            project_alerts = self._check_project(name)
+        if project_files is None:
+            project_files = [None] * len(projects)
+        results = list(_IO_POOL.map(self._check_project, projects, project_files))
+        for name, project_alerts in zip(projects, results):
             for alert in project_alerts:
                 if alert.startswith("missing"):
                     missing_files_map.append(
                         (name, alert.replace("missing ", "").split(", "))
                     )
                 alerts.append(f"⚠ {name}: {alert}")
+        self.app.call_from_thread(self._show_alerts, alerts, missing_files_map)
+
+    def _show_alerts(
+        self, alerts: list[str], missing_files_map: list[tuple[str, list[str]]]
+    ) -> None:
+        self.missing_files_map = missing_files_map
         self.query_one("#alerts-content", Static).update(
             "\n".join(alerts[:5]) if alerts else "✓ All projects healthy"
         )
-        return missing_files_map
 
-    def _check_project(self, name: str) -> list[str]:
+    def _check_project(
+        self, name: str, names: frozenset[str] | None = None
+    ) -> list[str]:
         alerts: list[str] = []
         project_path = PROJECTS_PATH / name
 
-        missing = []
-        for f in ["project.md", "session.md", "gotchas.md"]:
-            if not (project_path / f).exists():
-                missing.append(f)
+        if names is None:
+            names = _list_names(project_path)
+        missing = [f for f in PROJECT_FILES if f not in names]
         if missing:
             alerts.append(f"missing {', '.join(missing)}")
 
         session_md = project_path / "session.md"
-        if session_md.exists():
-            mtime = datetime.fromtimestamp(session_md.stat().st_mtime)
+        session_stamp = _file_stamp(session_md) if "session.md" in names else None
+        if session_stamp is not None:
+            mtime = datetime.fromtimestamp(session_stamp[0] / 1e9)
             days_old = (datetime.now() - mtime).days
             if days_old > self.STALE_DAYS:
                 alerts.append(f"session.md stale ({days_old}d)")
 
         project_md = project_path / "project.md"
-        if project_md.exists():
-            repo_path = parse_repo_path(project_md.read_text())
+        project_stamp = _file_stamp(project_md) if "project.md" in names else None
+        if project_stamp is not None:
+            # Shares the text cache with DetailPanel's project parse
+            repo_path = parse_repo_path(_read_cached(project_md, project_stamp))
             if repo_path:
-                if not repo_path.exists():
+                try:
+                    with os.scandir(repo_path) as it:
+                        # Same rule as _list_names: dangling links are missing
+                        repo_entries = {
+                            e.name: e
+                            for e in it
+                            if not e.is_symlink() or os.path.exists(e.path)
+                        }
+                except OSError:
                     alerts.append("repo path not found")
                 else:
-                    claude_md = repo_path / "CLAUDE.md"
-                    if not claude_md.exists():
+                    claude_md = repo_entries.get("CLAUDE.md")
+                    if claude_md is None:
                         alerts.append("CLAUDE.md missing in repo")
                     elif claude_md.is_symlink():
-                        target = claude_md.resolve()
-                        expected = project_path / "project.md"
-                        if target != expected.resolve():
+                        if not _symlink_points_to(claude_md.path, project_md):
                             alerts.append("CLAUDE.md symlink incorrect")
 
-                    agents_md = repo_path / "AGENTS.md"
-                    if not agents_md.exists():
+                    if "AGENTS.md" not in repo_entries:
                         alerts.append("AGENTS.md missing in repo")
             else:
                 alerts.append("no Repo: path in project.md")
@@ -346,9 +537,11 @@ class ClientItem(ListItem):
     def __init__(self, client: Client) -> None:
         super().__init__()
         self.client = client
+        # Computed once; compose can run again on every recompose
+        self.payment_status = client.payment_status()
 
     def compose(self) -> ComposeResult:
-        status = self.client.payment_status()
+        status = self.payment_status
         if status == "overdue":
             icon = "[red]✗[/red]"
         elif status == "due_soon":
@@ -386,33 +579,34 @@ class ClientDetailPanel(Static):
     client_id = reactive("")
 
     def compose(self) -> ComposeResult:
+        self._header = Static("Select a client", id="client-header")
+        self._billing = Static("", id="client-billing")
+        self._info = Static("", id="client-info")
+        self._projects = Static("", id="client-projects")
         yield Vertical(
-            Static("Select a client", id="client-header"),
-            Static("", id="client-billing"),
-            Static("", id="client-info"),
-            Static("", id="client-projects"),
+            self._header,
+            self._billing,
+            self._info,
+            self._projects,
             id="client-inner",
         )
 
     def watch_client_id(self, client_id: str) -> None:
-        from hawk.db import get_client
-
         if not client_id:
-            self.query_one("#client-header", Static).update("Select a client")
-            self.query_one("#client-billing", Static).update("")
-            self.query_one("#client-info", Static).update("")
-            self.query_one("#client-projects", Static).update("")
+            self._header.update("Select a client")
+            self._billing.update("")
+            self._info.update("")
+            self._projects.update("")
             return
 
         client = get_client(client_id)
         if not client:
             return
 
-        self.query_one("#client-header", Static).update(f"[bold]{client.name}[/bold]")
+        self._header.update(f"[bold]{client.name}[/bold]")
 
         billing_parts: list[str] = []
-        status = client.payment_status()
-        days = client.days_until_payment()
+        status, days = client.payment_status_and_days()
         if status == "overdue" and days is not None:
             billing_parts.append(f"[red bold]⚠ OVERDUE by {abs(days)} days[/red bold]")
         elif status == "due_soon" and days is not None:
@@ -425,9 +619,7 @@ class ClientDetailPanel(Static):
                 f"[cyan]Amount:[/cyan] ${client.amount} {client.currency} ({client.billing_cycle})"
             )
 
-        self.query_one("#client-billing", Static).update(
-            "\n".join(billing_parts) if billing_parts else ""
-        )
+        self._billing.update("\n".join(billing_parts) if billing_parts else "")
 
         info_parts: list[str] = []
         if client.company:
@@ -439,16 +631,12 @@ class ClientDetailPanel(Static):
         if client.notes:
             info_parts.append(f"[dim]{client.notes}[/dim]")
 
-        self.query_one("#client-info", Static).update(
-            "\n".join(info_parts) if info_parts else ""
-        )
+        self._info.update("\n".join(info_parts) if info_parts else "")
 
         if client.projects:
-            self.query_one("#client-projects", Static).update(
+            self._projects.update(
                 f"\n[green]Projects:[/green]\n"
                 + "\n".join(f"  • {p}" for p in client.projects)
             )
         else:
-            self.query_one("#client-projects", Static).update(
-                "\n[dim]No linked projects[/dim]"
-            )
+            self._projects.update("\n[dim]No linked projects[/dim]")